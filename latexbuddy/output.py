@@ -15,8 +15,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+from collections import defaultdict
+from functools import lru_cache
 from html import escape
 from operator import attrgetter
+from operator import itemgetter
 from pathlib import Path
 
 from jinja2 import Environment
@@ -30,6 +33,11 @@ from latexbuddy.problem import ProblemSeverity
 # TODO: Turn on autoescape after making sure it doesn't break templates
 env = Environment(loader=PackageLoader("latexbuddy"))  # noqa: S701
 
+# CSS classes of highlighted intervals, indexed by the severity's value
+_SEVERITY_CLASSES = {
+    severity.value: f"under is-{str(severity)}" for severity in ProblemSeverity
+}
+
 
 def problem_key(problem: Problem) -> int:
     """Returns a number for each problem to be able to sort them.
@@ -42,12 +50,13 @@ def problem_key(problem: Problem) -> int:
     """
     if problem.checker.lower() == "yalafi":
         return -3
-    if not problem.position:
+
+    # Problem guarantees the position to be either None or a tuple
+    position = problem.position
+    if position is None:
         return -2
-    if not isinstance(problem.position, tuple):
-        return -1
 
-    return problem.position[0]
+    return position[0]
 
 
 def render_flask_html(
@@ -110,7 +119,9 @@ def render_general_html(
 
     line_numbers = calculate_line_numbers(file_text)
 
-    highlighted_tex = highlight(file_text, problem_values)
+    # the highlighted code is followed by a line break, leaving an empty
+    # last line
+    highlighted_tex = highlight_lines(file_text, problem_values) + [""]
 
     final_pdf_path: str | None = pdf_path
     if Path(pdf_path).exists():
@@ -122,17 +133,10 @@ def render_general_html(
     else:
         final_pdf_path = None
 
-    #  list of lines
-    highlighted_tex = highlighted_tex.split("\n")
-
-    # map line number to lines
-    mapped = []
-    for i in range(0, len(line_numbers)):
-        mapped.append((line_numbers[i], highlighted_tex[i]))
-
     return template.render(
         file_name=file_name,
-        file_text=mapped,
+        # pairs of line number and line, consumed lazily by the template
+        file_text=zip(line_numbers, highlighted_tex),
         problems=problem_values,
         general_problems=general_problems,
         paths=path_list,
@@ -143,30 +147,33 @@ def render_general_html(
 def sort_problems(
     problems: dict[str, Problem],
 ) -> tuple[list[Problem], list[Problem]]:
-    problem_values = sorted(problems.values(), key=problem_key)
-    general_problems = [
-        problem for problem in problem_values if problem_key(problem) < 0
-    ]
-    problem_values = [
-        problem_value
-        for problem_value in problem_values
-        if problem_value not in general_problems
+    # decorate each problem with its key once, so that the partition
+    # below can reuse it as well
+    decorated = [
+        (problem_key(problem), problem) for problem in problems.values()
     ]
+    decorated.sort(key=itemgetter(0))
+
+    # general problems have negative keys
+    general_problems: list[Problem] = []
+    problem_values: list[Problem] = []
+    for key, problem in decorated:
+        if key >= 0:
+            problem_values.append(problem)
+        else:
+            general_problems.append(problem)
     return general_problems, problem_values
 
 
 def calculate_line_numbers(file_text: str) -> list[str]:
-    split_lines = file_text.split("\n")
-    line_numbers = []
-    line_count = len(split_lines)
-    for lineno in range(line_count):
-        diff = len(str(line_count)) - len(str(lineno))
-
-        line_numbers.append(
-            "&nbsp;" * 2 * diff + str(lineno) + "." + "&nbsp;",
-        )
+    line_count = file_text.count("\n") + 1
+    width = len(str(line_count))
 
-    return line_numbers
+    # lines are 1-based, just like the problems' positions
+    return [
+        "&nbsp;&nbsp;" * (width - len(str(lineno))) + f"{lineno}.&nbsp;"
+        for lineno in range(1, line_count + 1)
+    ]
 
 
 class Interval:
@@ -197,20 +204,27 @@ class Interval:
 
         self._problems = problems
 
-        if not start:
+        if start is None:
             for problem in self._problems:
                 if problem.position is not None:
                     self._start = problem.position[1]
                     break
             else:
                 self._start = 0
+        else:
+            self._start = start
 
-        self._end = end if end else self.start + problems[0].length
+        self._end = end if end is not None \
+            else self.start + problems[0].length
 
         if self.end < self.start:
             _msg = "End position can not be smaller than start position."
             raise ValueError(_msg)
 
+        # problems of an interval never change, so the severity can be
+        # determined right away instead of on every access
+        self._severity = max(problem.severity.value for problem in problems)
+
     @property
     def problems(self) -> list[Problem]:
         return self._problems
@@ -225,7 +239,7 @@ class Interval:
 
     @property
     def severity(self) -> int:
-        return max([problem.severity.value for problem in self.problems])
+        return self._severity
 
     @property
     def html_tag_title(self) -> str:
@@ -244,10 +258,8 @@ class Interval:
         :param other: other interval to consider
         """
 
-        if other.start < self.start:
-            return other.end > self.start
-
-        return other.start < self.end
+        # intervals are half-open, i.e., they don't include their end
+        return self.start < other.end and other.start < self.end
 
     def perform_intersection(self, other: Interval) -> list[Interval] | None:
         """Performs an intersection of two intervals and returns a list of new
@@ -303,47 +315,47 @@ def highlight(tex: str, problems: list[Problem]) -> str:
         <pre>
     """
 
-    tex_lines: list[str] = tex.splitlines(keepends=False)
-    line_intervals: list[list[Interval]] = \
-        create_empty_line_interval_list(tex_lines)
+    return "\n".join(highlight_lines(tex, problems)) + "\n"
 
-    add_basic_problem_intervals(line_intervals, problems, tex_lines)
 
-    for intervals in line_intervals:
-        resolve_interval_intersections(intervals)
+def highlight_lines(tex: str, problems: list[Problem]) -> list[str]:
+    """Highlights the TeX code using the problems' data line by line.
 
-    mark_intervals_in_tex(tex_lines, line_intervals)
+    This is the same as :func:`.highlight`, but the lines are not joined
+    back together, which spares callers from splitting them again.
 
-    return "\n".join(tex_lines) + "\n"
+    :param tex: TeX source
+    :param problems: list of problems
+    :return: list of HTML strings with highlighted errors, one for
+        every line of the TeX source
+    """
 
+    tex_lines: list[str] = tex.splitlines(keepends=False)
 
-def create_empty_line_interval_list(lines: list[str]) -> list[list[Interval]]:
-    """Creates and returns a list of (empty) lists of Intervals. The outer list
-    will contain exactly len(tex_lines) + 1 empty lists.
+    # most lines have no problems at all, so only lines with intervals
+    # get an entry
+    line_intervals: defaultdict[int, list[Interval]] = defaultdict(list)
 
-    :param lines: individual lines of a .tex-file as a list of strings
-    :returns: a list of empty lists that meet the specified dimensions
-    """
+    add_basic_problem_intervals(line_intervals, problems, tex_lines)
 
-    line_intervals: list[list[Interval]] = []
-    for _ in lines:
-        line_intervals.append([])
+    for intervals in line_intervals.values():
+        resolve_interval_intersections(intervals)
 
-    # when parsing, yalafi often marks the n+1'th line as erroneous
-    line_intervals.append([])
+    mark_intervals_in_tex(tex_lines, line_intervals)
 
-    return line_intervals
+    return tex_lines
 
 
 def add_basic_problem_intervals(
-    line_intervals: list[list[Interval]],
+    line_intervals: defaultdict[int, list[Interval]],
     problems: list[Problem],
     tex_lines: list[str],
 ) -> None:
     """Filters out problems without a position attribute or with length zero
     and inserts the remaining ones into the line_intervals list.
 
-    :param line_intervals: List of lists of Intervals for any given line
+    :param line_intervals: lists of Intervals for any given line index,
+        missing lines are created on demand
     :param problems: list of problems to be inserted as Intervals
     :param tex_lines: contents of the .tex-file
     """
@@ -396,6 +408,12 @@ def resolve_interval_intersections(intervals: list[Interval]) -> None:
     """Finds any intersecting intervals and replaces them with non-
     intersecting intervals that may contain more than one problem.
 
+    The intervals are sorted once and then swept from left to right.
+    Every start and end position marks a boundary; each section between
+    two consecutive boundaries, that is covered by at least one interval,
+    becomes a new interval containing the problems of all intervals
+    covering it.
+
     :param intervals: list of intervals in one line to be checked for
         intersections
     """
@@ -403,35 +421,55 @@ def resolve_interval_intersections(intervals: list[Interval]) -> None:
     if len(intervals) <= 1:
         return
 
-    next_index: int = 1
-
-    while next_index < len(intervals):
+    intervals.sort(key=attrgetter("start"))
+    boundaries = sorted(
+        {interval.start for interval in intervals}
+        | {interval.end for interval in intervals},
+    )
 
-        intervals.sort(key=attrgetter("start"))
+    resolved: list[Interval] = []
+    active: list[Interval] = []
+    next_index: int = 0
 
-        intersect_result = intervals[next_index - 1].perform_intersection(
-            intervals[next_index],
-        )
+    for section_start, section_end in zip(boundaries, boundaries[1:]):
 
-        if intersect_result is not None:
+        active = [
+            interval for interval in active if interval.end > section_start
+        ]
+        while (
+            next_index < len(intervals)
+            and intervals[next_index].start == section_start
+        ):
+            active.append(intervals[next_index])
+            next_index += 1
 
-            # remove both intersected intervals
-            intervals.pop(next_index - 1)
-            intervals.pop(next_index - 1)
+        if not active:
+            continue
 
-            insert_index: int = next_index - 1
+        if (
+            len(active) == 1
+            and active[0].start == section_start
+            and active[0].end == section_end
+        ):
+            # untouched interval, no need to create a new one
+            resolved.append(active[0])
+            continue
 
-            for new_interval in intersect_result:
-                intervals.insert(insert_index, new_interval)
-                insert_index += 1
+        resolved.append(
+            Interval(
+                [problem for interval in active
+                 for problem in interval.problems],
+                section_start,
+                section_end,
+            ),
+        )
 
-        else:
-            next_index += 1
+    intervals[:] = resolved
 
 
 def mark_intervals_in_tex(
     lines: list[str],
-    line_intervals: list[list[Interval]],
+    line_intervals: dict[int, list[Interval]],
 ) -> None:
     """Adds HTML marker-tags for every interval in multiple lines of TeX code.
 
@@ -444,14 +482,16 @@ def mark_intervals_in_tex(
     lines are modified in-place.
 
     :param lines: lines from the TeX file
-    :param line_intervals: list of non-intersecting intervals to be
-                           highlighted for every line
+    :param line_intervals: lists of non-intersecting intervals to be
+                           highlighted, indexed by line; lines without
+                           intervals may be omitted
     """
 
-    for i in range(len(lines)):
-        lines[i] = mark_intervals_in_tex_line(
-            lines[i], line_intervals[i],
-        )
+    for i, line in enumerate(lines):
+        intervals = line_intervals.get(i)
+        lines[i] = mark_intervals_in_tex_line(line, intervals) \
+            if intervals \
+            else escape(line)
 
 
 def mark_intervals_in_tex_line(line: str, intervals: list[Interval]) -> str:
@@ -467,35 +507,41 @@ def mark_intervals_in_tex_line(line: str, intervals: list[Interval]) -> str:
     :returns: resulting line as a string, containing ``<span>`` tags
     """
 
-    offset: int = 0
-    for i, interval in enumerate(intervals):
+    # the line is walked only once: the text before, inside and after
+    # each interval is escaped and collected, then joined at the end
+    parts: list[str] = []
+    position: int = 0
+    for interval in intervals:
         open_tag, close_tag = generate_wrapper_html_tags(interval)
 
-        start: int = interval.start + offset - 1
-        end: int = interval.end + offset - 1
+        start: int = interval.start - 1
+        end: int = interval.end - 1
 
-        preface = line[:start]
-        content = line[start:end]
-        appendix = line[end:]
+        parts.append(escape(line[position:start]))
+        parts.append(open_tag)
+        parts.append(escape(line[start:end]))
+        parts.append(close_tag)
 
-        escaped_content = escape(content)
-        escaped_preface = escape(preface) if i == 0 else preface
-        escaped_appendix = escape(appendix) \
-            if i == len(intervals) - 1 \
-            else appendix
+        position = end
 
-        line = (
-            f"{escaped_preface}"
-            f"{open_tag}{escaped_content}{close_tag}"
-            f"{escaped_appendix}"
-        )
+    parts.append(escape(line[position:]))
 
-        offset += len(open_tag) + len(close_tag)
-        offset += len(escaped_preface) - len(preface)
-        offset += len(escaped_content) - len(content)
-        offset += len(escaped_appendix) - len(appendix)
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def escape_tag_title(title: str) -> str:
+    """Escapes HTML control sequences and removes possible invalid linebreaks
+    in the title of a ``<span>`` tag.
+
+    Checkers tend to reuse the same descriptions throughout a document,
+    so the results are cached.
+
+    :param title: unescaped title of the tag
+    :returns: title, ready to be put inside an HTML attribute
+    """
 
-    return line
+    return escape(title.replace("\n", ""))
 
 
 def generate_wrapper_html_tags(interval: Interval) -> tuple[str, str]:
@@ -508,13 +554,12 @@ def generate_wrapper_html_tags(interval: Interval) -> tuple[str, str]:
               a closing ``<span>`` tag for the specified interval object
     """
 
-    # escape HTML control sequences and remove possible invalid linebreaks
-    escaped_title = escape(interval.html_tag_title.replace("\n", ""))
+    escaped_title = escape_tag_title(interval.html_tag_title)
 
     lid = interval.problems[0].uid + "List"
     opening_tag = (
         f"<span "
-        f'class="under is-{str(ProblemSeverity(interval.severity))}" '
+        f'class="{_SEVERITY_CLASSES[interval.severity]}" '
         f'title="{escaped_title}" '
         f"onclick=\"jumpTo('{lid}')\""
         f">"
@@ -17,9 +17,14 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 from abc import ABC
 from abc import abstractmethod
+from bisect import bisect_right
+from collections import defaultdict
+from functools import partial
 from typing import Callable
+from typing import Hashable
 
 from latexbuddy.problem import Problem
 from latexbuddy.problem import ProblemSeverity
@@ -27,6 +32,76 @@ from latexbuddy.texfile import TexFile
 
 LOG = logging.getLogger(__name__)
 
+# ProblemSeverity members by their (upper case) name
+_SEVERITIES: dict[str, ProblemSeverity] = dict(ProblemSeverity.__members__)
+
+# alternatives are tried in order, so the more specific commands must
+# precede the more generic ones; "invalid" catches any remaining command
+_COMMAND_PATTERNS = (
+    (
+        "ignore_next_one_line",
+        r"ignore-next(?:(?: 1)? line)?",
+    ),
+    (
+        "ignore_next_n_lines",
+        r"ignore-next (?P<n_lines>\d+) lines",
+    ),
+    (
+        "begin_ignore_anything",
+        r"begin-ignore",
+    ),
+    (
+        "begin_ignore_modules",
+        r"begin-ignore modules?(?P<begin_modules>(?: \S+)+)",
+    ),
+    (
+        "begin_ignore_severities",
+        r"begin-ignore (?:severity|severities)(?P<begin_severities>(?: \S+)+)",
+    ),
+    (
+        "begin_ignore_wl_keys",
+        r"begin-ignore whitelist-keys?(?P<begin_wl_keys>(?: \S+)+)",
+    ),
+    (
+        "end_ignore_anything",
+        r"end-ignore",
+    ),
+    (
+        "end_ignore_modules",
+        r"end-ignore modules?(?P<end_modules>(?: \S+)+)",
+    ),
+    (
+        "end_ignore_severities",
+        r"end-ignore (?:severity|severities)(?P<end_severities>(?: \S+)+)",
+    ),
+    (
+        "end_ignore_wl_keys",
+        r"end-ignore whitelist-keys?(?P<end_wl_keys>(?: \S+)+)",
+    ),
+    (
+        "invalid",
+        r"(?:ignore-next|begin-ignore|end-ignore)(?: \S+)*",
+    ),
+)
+
+# every line boundary recognized by str.splitlines() other than "\n";
+# these are normalized to "\n" so that the command regex and the line
+# counting only need to handle a single kind of line ending
+_LINE_BREAK_CHARS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_RE_LINE_BREAK = re.compile(r"\r\n|[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# commands span a whole line; the lookbehind anchors the leading "%" to
+# the start of a line without a "^", which would keep the regex engine
+# from skipping ahead to candidate "%" characters
+_RE_COMMAND = re.compile(
+    r"%(?<![^\n]%)[^\S\n]?buddy (?:"
+    + "|".join(
+        f"(?P<{name}>{pattern})" for name, pattern in _COMMAND_PATTERNS
+    )
+    + r")$",
+    re.MULTILINE,
+)
+
 
 class ProblemFilter(ABC):
     """Describes the base class for any problem filter.
@@ -42,13 +117,21 @@ class ProblemFilter(ABC):
     :meth:`.end` method.
 
     For more diverse filters, ProblemFilter provides the following
-    abstract methods which must be implemented by all subclasses:
+    methods which must be implemented by all subclasses:
     :meth:`.custom_match` and :meth:`.custom_parameters_equal`.
 
+    Subclasses may additionally implement
+    :meth:`.custom_parameters_key` and :meth:`.problem_parameters_key`,
+    which allows the :class:`~.Preprocessor` to index their filters
+    instead of calling :meth:`.match` for every problem. In that case,
+    :meth:`.custom_parameters_equal` need not be overridden.
+
     :param start_line: beginning of the filter's area
     :param end_line: end of the filter's area (open-ended, if omitted)
     """
 
+    __slots__ = ("start_line", "end_line")
+
     def __init__(self, start_line: int, end_line: int | None = None):
         self.start_line = start_line
         self.end_line = end_line
@@ -66,29 +149,14 @@ class ProblemFilter(ABC):
 
         return False
 
-    def __match_line(self, problem: Problem) -> bool:
-        """Determines, whether a given problem is located within the
-        ProblemFilter's line boundaries.
-
-        :param problem: Problem object to examine
-        :return: True, if the problem is located in the area covered by
-            the ProblemFilter, False otherwise
-        """
-
-        if problem.position is None:
-            return True
-
-        if self.end_line is None:
-            return self.start_line <= problem.position[0]
-
-        return self.start_line <= problem.position[0] <= self.end_line
-
     def match(self, problem: Problem) -> bool:
         """Matches custom filter's requirements against a problem.
 
         This method determines, whether a given problem is located
         within the filter's line boundaries and matches all custom
         requirements that the subclass implementation imposes.
+        Problems without a position are considered to be located within
+        any filter's line boundaries.
 
         :param problem: Problem object to examine
         :return: ``True``, if the problem is located in the area
@@ -96,7 +164,14 @@ class ProblemFilter(ABC):
                  requirements, ``False`` otherwise
         """
 
-        return self.__match_line(problem) and self.custom_match(problem)
+        position = problem.position
+        if position is not None and not (
+            self.start_line <= position[0]
+            and (self.end_line is None or position[0] <= self.end_line)
+        ):
+            return False
+
+        return self.custom_match(problem)
 
     @abstractmethod
     def custom_match(self, problem: Problem) -> bool:
@@ -108,7 +183,6 @@ class ProblemFilter(ABC):
                  requirements, ``False`` otherwise
         """
 
-    @abstractmethod
     def custom_parameters_equal(self, other: ProblemFilter) -> bool:
         """Determines, if two custom ``ProblemFilter`` objects are equal.
 
@@ -118,6 +192,11 @@ class ProblemFilter(ABC):
         * of the same type
         * equal in terms of their custom parameters
 
+        By default, this is the case if, and only if, their
+        :meth:`.custom_parameters_key` values are equal. Subclasses
+        that do not implement :meth:`.custom_parameters_key` must
+        override this method.
+
         .. caution::
            This method does not check the equality of `start_line``
            and ``end_line``!
@@ -128,11 +207,57 @@ class ProblemFilter(ABC):
                  to the current one, ``False`` otherwise
         """
 
+        key = self.custom_parameters_key()
+        if key is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not implement "
+                f"custom_parameters_equal()",
+            )
+
+        return key == other.custom_parameters_key()
+
+    def custom_parameters_key(self) -> tuple[type, Hashable] | None:
+        """Returns a hashable key describing the filter's type and custom
+        parameters.
+
+        Two filters with equal keys must match the same problems via
+        :meth:`.custom_match`.
+
+        :return: tuple of the filter type and its custom parameters, or
+                 ``None``, if the filter cannot be indexed; the latter
+                 is the default
+        """
+
+        return None
+
+    @classmethod
+    def problem_parameters_key(
+        cls,
+        problem: Problem,
+    ) -> tuple[type, Hashable] | None:
+        """Returns the key a filter of this type must have to match a given
+        Problem object based on its custom parameters.
+
+        A filter matches the custom requirements of a problem if, and
+        only if, its :meth:`.custom_parameters_key` equals this key.
+        This method is only used for filters that implement
+        :meth:`.custom_parameters_key`.
+
+        :param problem: Problem object to be examined
+        :return: tuple of the filter type and the problem's parameters,
+                 or ``None``, if filters of this type cannot be indexed;
+                 the latter is the default
+        """
+
+        return None
+
 
 class LineProblemFilter(ProblemFilter):
     """ProblemFilter implementation that only considers a problem's line
     position."""
 
+    __slots__ = ()
+
     def __init__(self, start_line: int, end_line: int | None = None):
         """Initializes a new LineProblemFilter with no custom parameters.
 
@@ -145,14 +270,30 @@ class LineProblemFilter(ProblemFilter):
     def custom_match(self, problem: Problem) -> bool:
         return True
 
-    def custom_parameters_equal(self, other: ProblemFilter) -> bool:
-        return isinstance(other, LineProblemFilter)
+    @classmethod
+    def parameters_key(cls) -> tuple[type, Hashable]:
+        """Returns the :meth:`.custom_parameters_key` of any
+        LineProblemFilter.
+
+        :return: tuple of the filter type and ``None``
+        """
+
+        return LineProblemFilter, None
+
+    def custom_parameters_key(self) -> tuple[type, Hashable]:
+        return self.parameters_key()
+
+    @classmethod
+    def problem_parameters_key(cls, problem: Problem) -> tuple[type, Hashable]:
+        return cls.parameters_key()
 
 
 class ModuleProblemFilter(ProblemFilter):
     """ProblemFilter implementation that filters problems, if they have been
     created by a specified LaTeXBuddy module."""
 
+    __slots__ = ("module_name",)
+
     def __init__(
         self,
         module_name: str,
@@ -174,15 +315,31 @@ class ModuleProblemFilter(ProblemFilter):
     def custom_match(self, problem: Problem) -> bool:
         return problem.checker == self.module_name
 
-    def custom_parameters_equal(self, other: ProblemFilter) -> bool:
-        return isinstance(other, ModuleProblemFilter) \
-            and other.module_name == self.module_name
+    @classmethod
+    def parameters_key(cls, module_name: str) -> tuple[type, Hashable]:
+        """Returns the :meth:`.custom_parameters_key` of a
+        ModuleProblemFilter for the given module.
+
+        :param module_name: name of the module
+        :return: tuple of the filter type and the module name
+        """
+
+        return ModuleProblemFilter, module_name
+
+    def custom_parameters_key(self) -> tuple[type, Hashable]:
+        return self.parameters_key(self.module_name)
+
+    @classmethod
+    def problem_parameters_key(cls, problem: Problem) -> tuple[type, Hashable]:
+        return cls.parameters_key(problem.checker)
 
 
 class SeverityProblemFilter(ProblemFilter):
     """ProblemFilter implementation that filters problems, if they have been
     created with a specified ProblemSeverity."""
 
+    __slots__ = ("severity",)
+
     def __init__(
         self,
         severity: ProblemSeverity,
@@ -203,9 +360,26 @@ class SeverityProblemFilter(ProblemFilter):
     def custom_match(self, problem: Problem) -> bool:
         return problem.severity == self.severity
 
-    def custom_parameters_equal(self, other: ProblemFilter) -> bool:
-        return isinstance(other, SeverityProblemFilter) \
-            and other.severity == self.severity
+    @classmethod
+    def parameters_key(
+        cls,
+        severity: ProblemSeverity,
+    ) -> tuple[type, Hashable]:
+        """Returns the :meth:`.custom_parameters_key` of a
+        SeverityProblemFilter for the given severity.
+
+        :param severity: ProblemSeverity level
+        :return: tuple of the filter type and the severity
+        """
+
+        return SeverityProblemFilter, severity
+
+    def custom_parameters_key(self) -> tuple[type, Hashable]:
+        return self.parameters_key(self.severity)
+
+    @classmethod
+    def problem_parameters_key(cls, problem: Problem) -> tuple[type, Hashable]:
+        return cls.parameters_key(problem.severity)
 
 
 class WhitelistKeyProblemFilter(ProblemFilter):
@@ -217,6 +391,8 @@ class WhitelistKeyProblemFilter(ProblemFilter):
     :param end_line: end of the filter's area
     """
 
+    __slots__ = ("wl_key",)
+
     def __init__(
         self,
         wl_key: str,
@@ -229,9 +405,147 @@ class WhitelistKeyProblemFilter(ProblemFilter):
     def custom_match(self, problem: Problem) -> bool:
         return problem.key == self.wl_key
 
-    def custom_parameters_equal(self, other: ProblemFilter) -> bool:
-        return isinstance(other, WhitelistKeyProblemFilter) \
-            and other.wl_key == self.wl_key
+    @classmethod
+    def parameters_key(cls, wl_key: str | None) -> tuple[type, Hashable]:
+        """Returns the :meth:`.custom_parameters_key` of a
+        WhitelistKeyProblemFilter for the given whitelist key.
+
+        :param wl_key: whitelist key
+        :return: tuple of the filter type and the whitelist key
+        """
+
+        return WhitelistKeyProblemFilter, wl_key
+
+    def custom_parameters_key(self) -> tuple[type, Hashable]:
+        return self.parameters_key(self.wl_key)
+
+    @classmethod
+    def problem_parameters_key(cls, problem: Problem) -> tuple[type, Hashable]:
+        return cls.parameters_key(problem.key)
+
+
+def _parse_severity(token: str, line_num: int) -> ProblemSeverity | None:
+    """Parses a severity name from a preprocessor command.
+
+    :param token: case-insensitive name of the severity
+    :param line_num: line number of command occurrence
+    :return: the named severity or ``None``, if there is no such severity
+    """
+
+    severity = _SEVERITIES.get(token.upper())
+    if severity is None:
+        LOG.warning(
+            f"Invalid syntax: "
+            f"Unknown ProblemSeverity '{token}' "
+            f"in line {line_num}",
+        )
+    return severity
+
+
+def _severity_filter(
+    token: str,
+    line_num: int,
+) -> SeverityProblemFilter | None:
+    """Creates an open-ended SeverityProblemFilter beginning in the line
+    after a preprocessor command.
+
+    :param token: case-insensitive name of the severity
+    :param line_num: line number of command occurrence
+    :return: the filter or ``None``, if there is no such severity
+    """
+
+    severity = _parse_severity(token, line_num)
+    if severity is None:
+        return None
+    return SeverityProblemFilter(severity, line_num + 1)
+
+
+def _severity_key(token: str, line_num: int) -> tuple[type, Hashable] | None:
+    """Returns the key of the SeverityProblemFilter for a severity name from
+    a preprocessor command.
+
+    :param token: case-insensitive name of the severity
+    :param line_num: line number of command occurrence
+    :return: the filter's key or ``None``, if there is no such severity
+    """
+
+    severity = _parse_severity(token, line_num)
+    if severity is None:
+        return None
+    return SeverityProblemFilter.parameters_key(severity)
+
+
+# displayed name, filter factory and filter key function of the commands
+# that begin or end ignoring problems with specific custom parameters;
+# both functions take a listed parameter and the line number of the
+# command and return None for invalid parameters; the factory creates an
+# open-ended filter beginning in the next line, the key function returns
+# the custom_parameters_key() such a filter has; the keys are the
+# suffixes of the corresponding command pattern groups
+_PARAMETER_COMMANDS: dict[
+    str,
+    tuple[
+        str,
+        Callable[[str, int], ProblemFilter | None],
+        Callable[[str, int], tuple[type, Hashable] | None],
+    ],
+] = {
+    "modules": (
+        "module",
+        lambda token, line_num: ModuleProblemFilter(token, line_num + 1),
+        lambda token, line_num: ModuleProblemFilter.parameters_key(token),
+    ),
+    "severities": ("severity", _severity_filter, _severity_key),
+    "wl_keys": (
+        "whitelist-key",
+        lambda token, line_num: WhitelistKeyProblemFilter(
+            token, line_num + 1,
+        ),
+        lambda token, line_num: WhitelistKeyProblemFilter.parameters_key(
+            token,
+        ),
+    ),
+}
+
+
+class _LineRangeIndex:
+    """Index over the line ranges of filters with equal custom parameters.
+
+    Overlapping and adjacent ranges are merged, which leaves a sorted
+    list of disjoint ranges. Thus, a line is covered if, and only if,
+    the last range starting at or before it reaches the line.
+    Open-ended ranges reach the end of the document.
+
+    :param filters: filters to be indexed
+    """
+
+    def __init__(self, filters: list[ProblemFilter]):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+
+        ranges = sorted(
+            (f.start_line, sys.maxsize if f.end_line is None else f.end_line)
+            for f in filters
+        )
+        for start, end in ranges:
+            if start > end:
+                continue  # e.g. "ignore-next 0 lines"
+
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def covers(self, line: int) -> bool:
+        """Determines, whether any indexed range covers a line.
+
+        :param line: line number to look up
+        :return: ``True``, if the line is covered, ``False`` otherwise
+        """
+
+        i = bisect_right(self.starts, line)
+        return i > 0 and self.ends[i - 1] >= line
 
 
 class Preprocessor:
@@ -240,48 +554,56 @@ class Preprocessor:
     the Preprocessor is capable of parsing buddy commands disguised as
     LaTeX comments from a TexFile object using regexes and is able to
     filter any given Problem or list of Problems accordingly.
-    """
-
-    __RE_COMMAND = re.compile(
-        r"%\s?buddy (ignore-next|begin-ignore|end-ignore)( (\S+))*",
-    )
-
-    __RE_IGNORE_NEXT_ONE_LINE = re.compile(
-        r"%\s?buddy ignore-next(?:(?: 1)? line)?",
-    )
-    __RE_IGNORE_NEXT_N_LINES = re.compile(
-        r"%\s?buddy ignore-next (\d+) lines",
-    )
-
-    __RE_BEGIN_IGNORE_ANYTHING = re.compile(
-        r"%\s?buddy begin-ignore",
-    )
-    __RE_BEGIN_IGNORE_MODULES = re.compile(
-        r"%\s?buddy begin-ignore (modules?)((?: \S+)+)",
-    )
-    __RE_BEGIN_IGNORE_SEVERITIES = re.compile(
-        r"%\s?buddy begin-ignore (?:severity|severities)((?: \S+)+)",
-    )
-    __RE_BEGIN_IGNORE_WL_KEYS = re.compile(
-        r"%\s?buddy begin-ignore (whitelist-keys?)((?: \S+)+)",
-    )
 
-    __RE_END_IGNORE_ANYTHING = re.compile(r"%\s?buddy end-ignore")
-    __RE_END_IGNORE_MODULES = re.compile(
-        r"%\s?buddy end-ignore (modules?)((?: \S+)+)",
-    )
-    __RE_END_IGNORE_SEVERITIES = re.compile(
-        r"%\s?buddy end-ignore (?:severity|severities)((?: \S+)+)",
-    )
-    __RE_END_IGNORE_WL_KEYS = re.compile(
-        r"%\s?buddy end-ignore (whitelist-keys?)((?: \S+)+)",
-    )
+    Matching uses an index of the filters implementing
+    :meth:`ProblemFilter.custom_parameters_key`; any other filters are
+    matched using :meth:`ProblemFilter.match`. The index is rebuilt
+    whenever :attr:`filters` is replaced or changes its length, or an
+    indexed open-ended filter has been ended via
+    :meth:`ProblemFilter.end`.
+    Thus, filters may be appended to :attr:`filters` at any time, but
+    should not be modified in any other way once they are part of it.
+    """
 
     def __init__(self) -> None:
         """Initializes a new Preprocessor instance with an empty list of
         filters."""
 
         self.filters: list[ProblemFilter] = []
+        # line ranges of the filters, grouped by their custom parameters
+        self.__filter_index: dict[Hashable, _LineRangeIndex] = {}
+        self.__problem_key_getters: list[Callable[[Problem], Hashable]] = []
+        # filters without custom parameters key, matched one by one
+        self.__unindexed_filters: list[ProblemFilter] = []
+        # state of the filters the index was built from
+        self.__indexed_filters = self.filters
+        self.__indexed_filter_count = 0
+        self.__indexed_open_ended_filters: list[ProblemFilter] = []
+        self.__open_ended_filters: dict[Hashable, ProblemFilter] = {}
+        self.__command_handlers: dict[
+            str,
+            Callable[[re.Match[str], int], list[ProblemFilter]],
+        ] = {
+            "ignore_next_one_line":
+                self.__regex_match_command_pattern_ignore_next_one_line,
+            "ignore_next_n_lines":
+                self.__regex_match_command_pattern_ignore_next_n_lines,
+            "begin_ignore_anything":
+                self.__regex_match_command_pattern_begin_ignore_anything,
+            "end_ignore_anything":
+                self.__regex_match_command_pattern_end_ignore_anything,
+            "invalid": self.__regex_match_command_pattern_invalid,
+        }
+        for kind, (name, create_filter, filter_key) in (
+            _PARAMETER_COMMANDS.items()
+        ):
+            self.__command_handlers[f"begin_ignore_{kind}"] = partial(
+                self.__begin_ignore_parameters,
+                f"begin_{kind}", name, create_filter,
+            )
+            self.__command_handlers[f"end_ignore_{kind}"] = partial(
+                self.__end_ignore_parameters, f"end_{kind}", name, filter_key,
+            )
 
     def regex_parse_preprocessor_comments(self, file: TexFile) -> None:
         """Parses preprocessor statements in a TeX file.
@@ -296,16 +618,30 @@ class Preprocessor:
                      to be parsed
         """
 
-        line_num = 0  # lines are 1-based
-        for line in file.tex.splitlines():
+        tex = file.tex
 
-            line_num += 1  # lines are 1-based
+        # substring search is much faster than any regex, so documents
+        # without commands are neither normalized nor scanned, and the
+        # scan skips straight to the line of the first potential command
+        first_command = tex.find("buddy")
+        if first_command == -1:
+            return
 
-            if not Preprocessor.__RE_COMMAND.fullmatch(line):
-                continue
+        if any(char in tex for char in _LINE_BREAK_CHARS):
+            tex = _RE_LINE_BREAK.sub("\n", tex)
+            first_command = tex.find("buddy")
+
+        line_num = 1  # lines are 1-based
+        line_start = 0
+        scan_start = tex.rfind("\n", 0, first_command) + 1
+
+        for match in _RE_COMMAND.finditer(tex, scan_start):
+
+            line_num += tex.count("\n", line_start, match.start())
+            line_start = match.start()
 
             resulting_filters = self.__regex_parse_cmd_args_to_filter(
-                line, line_num,
+                match, line_num,
             )
 
             for resulting_filter in resulting_filters:
@@ -313,114 +649,94 @@ class Preprocessor:
 
     def __regex_parse_cmd_args_to_filter(
         self,
-        line: str,
+        match: re.Match[str],
         line_num: int,
     ) -> list[ProblemFilter]:
         """Parses a preprocessor statement into filters.
 
-        :param line: the LaTeX code line which contains the preprocessor
-            command to be parsed
+        :param match: match of the preprocessor command to be parsed
         :param line_num: line number of the LaTeX code line to be parsed
         :return: a list of zero or more ProblemFilters resulting from
             the preprocessor command
         """
 
-        matchers: list[Callable[[str, int], list[ProblemFilter] | None]] = [
-            self.__regex_match_command_pattern_ignore_next_one_line,
-            self.__regex_match_command_pattern_ignore_next_n_lines,
-            self.__regex_match_command_pattern_begin_ignore_anything,
-            self.__regex_match_command_pattern_begin_ignore_modules,
-            self.__regex_match_command_pattern_begin_ignore_severities,
-            self.__regex_match_command_pattern_begin_ignore_wl_keys,
-            self.__regex_match_command_pattern_end_ignore_anything,
-            self.__regex_match_command_pattern_end_ignore_modules,
-            self.__regex_match_command_pattern_end_ignore_severities,
-            self.__regex_match_command_pattern_end_ignore_wl_keys,
-        ]
+        # every alternative of the command pattern is a named group
+        handler = self.__command_handlers[match.lastgroup]  # type: ignore
+        return handler(match, line_num)
 
-        for matcher in matchers:
+    def __regex_match_command_pattern_invalid(
+        self,
+        match: re.Match[str],
+        line_num: int,
+    ) -> list[ProblemFilter]:
+        """Reports a preprocessor command that could not be parsed.
 
-            match = matcher(line, line_num)
-            if match is not None:
-                return match
+        :param match: match of the invalid command
+        :param line_num: line number of command occurrence
+        :return: empty list
+        """
 
         LOG.warning(
             f"Invalid Syntax: Could not parse preprocessing command "
-            f"in line {line_num}: \n{line}",
+            f"in line {line_num}: \n{match.group().rstrip()}",
         )
         return []
 
     def __regex_match_command_pattern_ignore_next_one_line(
         self,
-        line: str,
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command matches the regex pattern and
-        creates LineProblemFilters beginning and ending at line_num + 1.
+    ) -> list[ProblemFilter]:
+        """Creates LineProblemFilters beginning and ending at line_num + 1.
 
-        :param line: inserted command from .tex file
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: LineProblemFilter as a list, None if regex not matching
+        :return: LineProblemFilter as a list
         """
 
-        match = Preprocessor.__RE_IGNORE_NEXT_ONE_LINE.fullmatch(line)
-        if match is not None:
-            LOG.debug(
-                f"Created LineProblemFilter "
-                f"from line {line_num + 1} to {line_num + 1}",
-            )
-            return [LineProblemFilter(line_num + 1, line_num + 1)]
-
-        return None
+        LOG.debug(
+            f"Created LineProblemFilter "
+            f"from line {line_num + 1} to {line_num + 1}",
+        )
+        return [LineProblemFilter(line_num + 1, line_num + 1)]
 
     def __regex_match_command_pattern_ignore_next_n_lines(
         self,
-        line: str,
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command matches the regex pattern and
-        creates a LineProblemFilter beginning at line_num + 1 and ending at
+    ) -> list[ProblemFilter]:
+        """Creates a LineProblemFilter beginning at line_num + 1 and ending at
         line_num + n. The number of lines to ignore (n) is drawn from the
         command.
 
-        :param line: inserted command from .tex file
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: LineProblemFilter as a list, None if regex not matching
+        :return: LineProblemFilter as a list
         """
 
-        match = Preprocessor.__RE_IGNORE_NEXT_N_LINES.fullmatch(line)
-        if match is not None:
-            n = int(match.group(1))
-            LOG.debug(
-                f"Created LineProblemFilter "
-                f"from line {line_num + 1} to {line_num + n}",
-            )
-            return [LineProblemFilter(line_num + 1, line_num + n)]
-
-        return None
+        n = int(match.group("n_lines"))
+        LOG.debug(
+            f"Created LineProblemFilter "
+            f"from line {line_num + 1} to {line_num + n}",
+        )
+        return [LineProblemFilter(line_num + 1, line_num + n)]
 
     def __regex_match_command_pattern_begin_ignore_anything(
         self,
-        line: str,
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
+    ) -> list[ProblemFilter]:
         """Creates a line filter.
 
-        Checks, if the provided command matches the regex pattern and
-        creates a ``LineProblemFilter`` beginning at ``line_num + 1``.
+        Creates a ``LineProblemFilter`` beginning at ``line_num + 1``.
 
-        :param line: inserted command from .tex file
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: open-ended ``LineProblemFilter`` as a list,
-                 ``None`` if regex not matching
+        :return: open-ended ``LineProblemFilter`` as a list
         """
 
-        match = Preprocessor.__RE_BEGIN_IGNORE_ANYTHING.fullmatch(line)
-        if match is None:
-            return None
-
         open_ended_filter = self.__get_open_ended_filter(
-            LineProblemFilter(0),
+            LineProblemFilter.parameters_key(),
         )
 
         if open_ended_filter is None:
@@ -428,7 +744,7 @@ class Preprocessor:
                 f"Created open-ended LineProblemFilter "
                 f"beginning in line {line_num + 1}",
             )
-            return [LineProblemFilter(line_num + 1)]
+            return [self.__open_filter(LineProblemFilter(line_num + 1))]
 
         LOG.info(
             f"Ignored duplicate command 'begin-ignore' "
@@ -436,343 +752,257 @@ class Preprocessor:
         )
         return []
 
-    def __regex_match_command_pattern_begin_ignore_modules(
+    def __regex_match_command_pattern_end_ignore_anything(
         self,
-        line: str,
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Creates filters with respect to the ignored modules.
-
-        Checks, if the provided command matches the regex pattern and
-        creates ModuleProblemFilters corresponding to the provided
-        module names beginning at ``line_num + 1``.
+    ) -> list[ProblemFilter]:
+        """Sets the end line for the matching open-ended ProblemFilter.
 
-        :param line: inserted command from .tex file
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: list of open-ended ``ModuleProblemFilter`` objectss to
-                 match the provided modules, ``None`` if regex not
-                 matching
+        :return: empty list
         """
 
-        match = Preprocessor.__RE_BEGIN_IGNORE_MODULES.fullmatch(line)
-        if match is not None:
-            modules = match.group(1).strip().split(" ")
-
-            filters: list[ProblemFilter] = []
-            for module in modules:
-
-                open_ended_filter = self.__get_open_ended_filter(
-                    ModuleProblemFilter(module, 0),
-                )
+        open_ended_filter = self.__get_open_ended_filter(
+            LineProblemFilter.parameters_key(),
+        )
 
-                if open_ended_filter is not None:
-                    LOG.info(
-                        f"Ignored duplicate command 'begin-ignore' "
-                        f"for module '{module}' in line {line_num}",
-                    )
-                else:
-                    LOG.debug(
-                        f"Created open-ended ModuleProblemFilter "
-                        f"for module '{module}' "
-                        f"beginning in line {line_num + 1}",
-                    )
-                    filters.append(ModuleProblemFilter(module, line_num + 1))
-
-            return filters
+        if open_ended_filter is None:
+            LOG.info(
+                f"Ignored duplicate command 'end-ignore' "
+                f"in line {line_num}",
+            )
+        else:
+            LOG.debug(
+                f"Ended existing open-ended LineProblemFilter "
+                f"in line {line_num}",
+            )
+            self.__close_filter(open_ended_filter, line_num)
 
-        return None
+        return []
 
-    def __regex_match_command_pattern_begin_ignore_severities(
+    def __begin_ignore_parameters(
         self,
-        line: str,
+        group: str,
+        name: str,
+        create_filter: Callable[[str, int], ProblemFilter | None],
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command matches the regex pattern and
-        creates SeverityProblemFilters corresponding to the provided severities
-        beginning at line_num + 1.
-
-        :param line: inserted command from .tex file
-        :param line_num: line number of command occurrence
-        :return: list of open-ended SeverityProblemFilters to match the
-            provided severities, None if regex not matching
-        """
-
-        match = Preprocessor.__RE_BEGIN_IGNORE_SEVERITIES.fullmatch(line)
-        if match is not None:
-            severities = match.group(1).strip().split(" ")
-
-            filters: list[ProblemFilter] = []
-            for severity in severities:
-
-                try:
-                    enum_severity = ProblemSeverity[severity.upper()]
-
-                    open_ended_filter = self.__get_open_ended_filter(
-                        SeverityProblemFilter(enum_severity, 0),
-                    )
-
-                    if open_ended_filter is not None:
-                        LOG.info(
-                            f"Ignored duplicate command 'begin-ignore' "
-                            f"for severity '{severity}' in line {line_num}",
-                        )
-                    else:
-                        LOG.debug(
-                            f"Created open-ended ModuleProblemFilter "
-                            f"for severity '{str(enum_severity)}' "
-                            f"beginning in line {line_num + 1}",
-                        )
-                        filters.append(
-                            SeverityProblemFilter(enum_severity, line_num + 1),
-                        )
-                except KeyError:
-                    LOG.warning(
-                        f"Invalid syntax: "
-                        f"Unknown ProblemSeverity '{severity}' "
-                        f"in line {line_num}",
-                    )
-
-            return filters
-
-        return None
+    ) -> list[ProblemFilter]:
+        """Creates filters with respect to the provided custom parameters.
 
-    def __regex_match_command_pattern_begin_ignore_wl_keys(
-        self,
-        line: str,
-        line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command matches the regex pattern and
-        creates WhitelistKeyProblemFilters corresponding to the provided
-        whitelist keys beginning at line_num + 1.
+        Creates a filter beginning at ``line_num + 1`` for each
+        parameter listed in the command, unless such a filter is already
+        open.
 
-        :param line: inserted command from .tex file
+        :param group: name of the match group listing the parameters
+        :param name: name of the parameter kind used in log messages
+        :param create_filter: function creating the filter for a listed
+            parameter, which returns ``None`` for invalid parameters
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: list of open-ended WhitelistKeyProblemFilters to match
-            the provided whitelist keys, None if regex not matching
+        :return: list of the newly opened filters
         """
 
-        match = Preprocessor.__RE_BEGIN_IGNORE_WL_KEYS.fullmatch(line)
-        if match is not None:
-            keys = match.group(1).strip().split(" ")
+        filters: list[ProblemFilter] = []
+        for token in match.group(group).split():
 
-            filters: list[ProblemFilter] = []
-            for key in keys:
+            new_filter = create_filter(token, line_num)
+            if new_filter is None:
+                continue
 
-                open_ended_filter = self.__get_open_ended_filter(
-                    WhitelistKeyProblemFilter(key, 0),
-                )
+            # the new filter is only discarded for duplicate commands
+            open_ended_filter = self.__get_open_ended_filter(
+                new_filter.custom_parameters_key(),
+            )
 
-                if open_ended_filter is not None:
-                    LOG.info(
-                        f"Ignored duplicate command 'begin-ignore' "
-                        f"for whitelist-key '{key}' in line {line_num}",
-                    )
-                else:
-                    LOG.debug(
-                        f"Created open-ended WhitelistKeyProblemFilter "
-                        f"for whitelist-key '{key}' beginning "
-                        f"in line {line_num + 1}",
-                    )
-                    filters.append(
-                        WhitelistKeyProblemFilter(key, line_num + 1),
-                    )
-
-            return filters
+            if open_ended_filter is not None:
+                LOG.info(
+                    f"Ignored duplicate command 'begin-ignore' "
+                    f"for {name} '{token}' in line {line_num}",
+                )
+            else:
+                LOG.debug(
+                    f"Created open-ended {type(new_filter).__name__} "
+                    f"for {name} '{token}' "
+                    f"beginning in line {line_num + 1}",
+                )
+                filters.append(self.__open_filter(new_filter))
 
-        return None
+        return filters
 
-    def __regex_match_command_pattern_end_ignore_anything(
+    def __end_ignore_parameters(
         self,
-        line: str,
+        group: str,
+        name: str,
+        filter_key: Callable[[str, int], tuple[type, Hashable] | None],
+        match: re.Match[str],
         line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command (line) matches the regex pattern and
-        sets the end line for the matching open-ended ProblemFilter.
-
-        :param line: inserted command from .tex file
+    ) -> list[ProblemFilter]:
+        """Sets the end line for the open-ended filters matching the
+        provided custom parameters.
+
+        :param group: name of the match group listing the parameters
+        :param name: name of the parameter kind used in log messages
+        :param filter_key: function returning the key of the filter for
+            a listed parameter, which returns ``None`` for invalid
+            parameters
+        :param match: match of the command from .tex file
         :param line_num: line number of command occurrence
-        :return: empty list, if successful; None otherwise
+        :return: empty list
         """
 
-        match = Preprocessor.__RE_END_IGNORE_ANYTHING.fullmatch(line)
-        if match is not None:
+        for token in match.group(group).split():
 
-            open_ended_filter = self.__get_open_ended_filter(
-                LineProblemFilter(0),
-            )
+            key = filter_key(token, line_num)
+            if key is None:
+                continue
+
+            open_ended_filter = self.__get_open_ended_filter(key)
 
             if open_ended_filter is None:
                 LOG.info(
                     f"Ignored duplicate command 'end-ignore' "
-                    f"in line {line_num}",
+                    f"for {name} '{token}' in line {line_num}",
                 )
             else:
                 LOG.debug(
-                    f"Ended existing open-ended LineProblemFilter "
-                    f"in line {line_num}",
+                    f"Ended existing open-ended "
+                    f"{type(open_ended_filter).__name__} "
+                    f"for {name} '{token}' in line {line_num}",
                 )
-                open_ended_filter.end(line_num)
+                self.__close_filter(open_ended_filter, line_num)
 
-            return []
-
-        return None
+        return []
 
-    def __regex_match_command_pattern_end_ignore_modules(
+    def __get_open_ended_filter(
         self,
-        line: str,
-        line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command (line) matches the regex pattern and
-        sets the end line for the matching open-ended ProblemFilter.
+        key: Hashable,
+    ) -> ProblemFilter | None:
+        """Searches for any open-ended (no end set) ProblemFilter with the
+        provided custom parameters key.
 
-        :param line: inserted command from .tex file
-        :param line_num: line number of command occurrence
-        :return: empty list, if successful; None otherwise
+        :param key: :meth:`~.ProblemFilter.custom_parameters_key` of the
+            open-ended filter
+        :return: matching open-ended filter, if found
         """
 
-        match = Preprocessor.__RE_END_IGNORE_MODULES.fullmatch(line)
-        if match is not None:
-            modules = match.group(1).strip().split(" ")
-
-            for module in modules:
+        return self.__open_ended_filters.get(key)
 
-                open_ended_filter = self.__get_open_ended_filter(
-                    ModuleProblemFilter(module, 0),
-                )
+    def __open_filter(self, problem_filter: ProblemFilter) -> ProblemFilter:
+        """Registers a new open-ended ProblemFilter, so that it can be found
+        by :meth:`__get_open_ended_filter`.
 
-                if open_ended_filter is None:
-                    LOG.info(
-                        f"Ignored duplicate command 'end-ignore' "
-                        f"for module '{module}' "
-                        f"in line {line_num}",
-                    )
-                else:
-                    LOG.debug(
-                        f"Ended existing open-ended ModuleProblemFilter "
-                        f"for module '{module}' in line {line_num + 1}",
-                    )
-                    open_ended_filter.end(line_num)
-
-            return []
+        :param problem_filter: open-ended filter to register
+        :return: the registered filter
+        """
 
-        return None
+        self.__open_ended_filters[
+            problem_filter.custom_parameters_key()
+        ] = problem_filter
+        return problem_filter
 
-    def __regex_match_command_pattern_end_ignore_severities(
+    def __close_filter(
         self,
-        line: str,
-        line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command (line) matches the regex pattern and
-        sets the end line for the matching open-ended ProblemFilter.
+        problem_filter: ProblemFilter,
+        end_line: int,
+    ) -> None:
+        """Ends a registered open-ended ProblemFilter and unregisters it.
 
-        :param line: inserted command from .tex file
-        :param line_num: line number of command occurrence
-        :return: empty list, if successful; None otherwise
+        :param problem_filter: open-ended filter to end
+        :param end_line: line number of the filter's end
         """
 
-        match = Preprocessor.__RE_END_IGNORE_SEVERITIES.fullmatch(line)
-        if match is not None:
-            severities = match.group(1).strip().split(" ")
-
-            for severity in severities:
-
-                try:
-                    enum_severity = ProblemSeverity[severity.upper()]
-
-                    open_ended_filter = self.__get_open_ended_filter(
-                        SeverityProblemFilter(enum_severity, 0),
-                    )
-
-                    if open_ended_filter is None:
-                        LOG.info(
-                            f"Ignored duplicate command 'end-ignore' "
-                            f"for severity '{severity}' in line {line_num}",
-                        )
-                    else:
-                        LOG.debug(
-                            f"Ended existing open-ended SeverityProblemFilter "
-                            f"for severity '{str(enum_severity)}' "
-                            f"in line {line_num + 1}",
-                        )
-                        open_ended_filter.end(line_num)
-                except KeyError:
-                    LOG.warning(
-                        f"Invalid syntax: "
-                        f"Unknown ProblemSeverity '{severity}' "
-                        f"in line {line_num}",
-                    )
-
-            return []
+        problem_filter.end(end_line)
+        del self.__open_ended_filters[problem_filter.custom_parameters_key()]
 
-        return None
+    def __build_filter_index(self) -> None:
+        """Groups the filters by their custom parameters and indexes the
+        line ranges of each group."""
 
-    def __regex_match_command_pattern_end_ignore_wl_keys(
-        self,
-        line: str,
-        line_num: int,
-    ) -> list[ProblemFilter] | None:
-        """Checks, if the provided command (line) matches the regex pattern and
-        sets the end line for the matching open-ended ProblemFilter.
+        groups: defaultdict[
+            tuple[type, Hashable],
+            list[ProblemFilter],
+        ] = defaultdict(list)
+        unindexed_filters: list[ProblemFilter] = []
+        for f in self.filters:
+            key = f.custom_parameters_key()
+            if key is None:
+                unindexed_filters.append(f)
+            else:
+                groups[key].append(f)
+
+        self.__filter_index = {
+            key: _LineRangeIndex(group) for key, group in groups.items()
+        }
+        self.__problem_key_getters = [
+            filter_type.problem_parameters_key
+            for filter_type in {
+                type(f) for group in groups.values() for f in group
+            }
+        ]
+        self.__unindexed_filters = unindexed_filters
 
-        :param line: inserted command from .tex file
-        :param line_num: line number of command occurrence
-        :return: empty list, if successful; None otherwise
-        """
+        self.__indexed_filters = self.filters
+        self.__indexed_filter_count = len(self.filters)
+        self.__indexed_open_ended_filters = [
+            f for f in self.filters if f.end_line is None
+        ]
 
-        match = Preprocessor.__RE_END_IGNORE_WL_KEYS.fullmatch(line)
-        if match is not None:
-            keys = match.group(1).strip().split(" ")
+    def __update_filter_index(self) -> None:
+        """Rebuilds the filter index, if the filters have changed since it
+        was built."""
 
-            for key in keys:
+        if (
+            self.filters is not self.__indexed_filters
+            or len(self.filters) != self.__indexed_filter_count
+        ):
+            self.__build_filter_index()
+            return
 
-                open_ended_filter = self.__get_open_ended_filter(
-                    WhitelistKeyProblemFilter(key, 0),
-                )
+        for f in self.__indexed_open_ended_filters:
+            if f.end_line is not None:
+                self.__build_filter_index()
+                return
 
-                if open_ended_filter is None:
-                    LOG.info(
-                        f"Ignored duplicate command 'end-ignore' "
-                        f"for whitelist-key '{key}' in line {line_num}",
-                    )
-                else:
-                    LOG.debug(
-                        f"Ended existing open-ended WhitelistKeyProblemFilter "
-                        f"for whitelist-key '{key}' in line {line_num + 1}",
-                    )
-                    open_ended_filter.end(line_num)
+    def matches_preprocessor_filter(self, problem: Problem) -> bool:
+        """Checks, if the provided Problem matches any filter.
 
-            return []
+        :param problem: Problem to check
+        :return: false if matching; true otherwise
+        """
 
-        return None
+        self.__update_filter_index()
+        return self.__matches_filter_index(problem)
 
-    def __get_open_ended_filter(
-        self,
-        reference_filter: ProblemFilter,
-    ) -> ProblemFilter | None:
-        """Searches for any open-ended (no end set) ProblemFilter matching the
-        provided reference ProblemFilter.
+    def __matches_filter_index(self, problem: Problem) -> bool:
+        """Checks, if the provided Problem matches any filter, using the
+        filter index as it is.
 
-        :param reference_filter: reference to find matching open-ended
-            filter
-        :return: matching open-ended filter, if found
+        :param problem: Problem to check
+        :return: false if matching; true otherwise
         """
 
-        for f in self.filters:
-            if f.end_line is not None:
-                continue
-            if not f.custom_parameters_equal(reference_filter):
+        position = problem.position
+        line = None if position is None else position[0]
+        for problem_parameters_key in self.__problem_key_getters:
+
+            line_ranges = self.__filter_index.get(
+                problem_parameters_key(problem),
+            )
+            if line_ranges is None:
                 continue
-            return f
 
-        return None
+            # problems without a position match regardless of the lines
+            if line is None or line_ranges.covers(line):
+                return False
 
-    def matches_preprocessor_filter(self, problem: Problem) -> bool:
-        """Checks, if the provided Problem matches any filter.
+        for f in self.__unindexed_filters:
+            if f.match(problem):
+                return False
 
-        :param problem: Problem to check
-        :return: false if matching; true otherwise
-        """
-        return all(not f.match(problem) for f in self.filters)
+        return True
 
     def apply_preprocessor_filter(
         self,
@@ -784,4 +1014,9 @@ class Preprocessor:
         :param problems: list of Problems to filter
         :return: filtered list of Problems
         """
-        return list(filter(self.matches_preprocessor_filter, problems))
+
+        self.__update_filter_index()
+        if not self.__filter_index and not self.__unindexed_filters:
+            return list(problems)
+
+        return [p for p in problems if self.__matches_filter_index(p)]
@@ -21,11 +21,11 @@ surely not display extra metadata.
 """
 from __future__ import annotations
 
+import itertools
 import logging
-import time
+import os
 import typing
-from enum import Enum
-from functools import total_ordering
+from enum import IntEnum
 from json import JSONEncoder
 from pathlib import Path
 
@@ -38,9 +38,12 @@ LOG = logging.getLogger(__name__)
 # static variable used for a uniform key generation
 language: str | None = None
 
+# sequence numbers for UID generation; problems are created in worker
+# processes, so the UIDs are additionally prefixed with the process ID
+_uid_counter = itertools.count()
 
-@total_ordering
-class ProblemSeverity(Enum):
+
+class ProblemSeverity(IntEnum):
     """Defines possible problem severity grades.
 
     Problem severity is usually preset by the checkers themselves.
@@ -71,16 +74,6 @@ class ProblemSeverity(Enum):
     def __str__(self) -> str:
         return self.name.lower()
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, ProblemSeverity):
-            return NotImplemented
-        return self.value == other.value
-
-    def __lt__(self, other: object) -> bool:
-        if not isinstance(other, ProblemSeverity):
-            return NotImplemented
-        return self.value < other.value
-
 
 def set_language(lang: str | None) -> None:
     """Sets the static variable language used for key generation.
@@ -100,6 +93,22 @@ class Problem:
     word.
     """
 
+    __slots__ = (
+        "position",
+        "length",
+        "text",
+        "checker",
+        "p_type",
+        "file",
+        "severity",
+        "category",
+        "description",
+        "context",
+        "suggestions",
+        "key",
+        "uid",
+    )
+
     def __init__(
         self,
         position: tuple[int, int] | None,
@@ -143,7 +152,10 @@ class Problem:
         # importing these here to avoid circular import error
         from latexbuddy.buddy import LatexBuddy
 
-        self.position = position
+        # consumers rely on the position being a tuple, e.g., for sorting
+        self.position = (position[0], position[1]) \
+            if position is not None \
+            else None
 
         if length is None:
             length = 0
@@ -233,7 +245,7 @@ class Problem:
 
         :return: a unique UID for the Problem object
         """
-        return str(time.time())
+        return f"{os.getpid()}-{next(_uid_counter)}"
 
     def __get_pos_str(self) -> str:
         """Returns the string value of the problem's position.
@@ -78,6 +78,7 @@ class TexFile:
             self.tex = ""
 
         self.plain, self._charmap, self._parse_problems = self.__detex()
+        self._line_offsets = get_line_offsets(self.plain)
 
         _, plain_path = mkstemp(suffix=".detexed", prefix=self.tex_file.stem)
         self.plain_file = Path(plain_path)
@@ -138,7 +139,9 @@ class TexFile:
         :return: line and column number of the respective char in the
             tex file
         """
-        line, col, offsets = absolute_to_linecol(self.plain, char_pos)
+        line, col, offsets = absolute_to_linecol(
+            self.plain, char_pos, self._line_offsets,
+        )
 
         aux = translate_numbers(
             self.tex, self.plain,
@@ -155,12 +158,11 @@ class TexFile:
         line: int,
         col: int,
     ) -> tuple[int, int]:
-        offsets = get_line_offsets(self.plain)
         aux = translate_numbers(
             self.tex,
             self.plain,
             self._charmap,
-            offsets,
+            self._line_offsets,
             line,
             col,
         )
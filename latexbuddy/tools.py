@@ -115,14 +115,18 @@ location_re = re.compile(r"line (\d+), column (\d+)")
 def absolute_to_linecol(
     text: str,
     position: int,
+    line_offsets: list[int] | None = None,
 ) -> tuple[int, int, list[int]]:
     """Calculates line and column number for an absolute character position.
 
     :param text: text of file to find line:col position for
     :param position: absolute 0-based character position
+    :param line_offsets: line offsets of the text as returned by
+        :func:`get_line_offsets`; calculated from the text, if omitted
     :return: line number, column number, line offsets
     """
-    line_offsets = get_line_offsets(text)
+    if line_offsets is None:
+        line_offsets = get_line_offsets(text)
     line = 0  # [0, ...]
     while position >= line_offsets[line]:
         line += 1
@@ -22,8 +22,13 @@ from string import ascii_lowercase
 import pytest
 
 from latexbuddy.modules.aspell import Aspell
+from latexbuddy.modules.yalafi_checker import YaLafi
+from latexbuddy.output import calculate_line_numbers
+from latexbuddy.output import highlight
 from latexbuddy.output import Interval
 from latexbuddy.output import render_html
+from latexbuddy.output import resolve_interval_intersections
+from latexbuddy.output import sort_problems
 from latexbuddy.problem import Problem
 from latexbuddy.problem import ProblemSeverity
 
@@ -63,6 +68,50 @@ def test_render_html(tmp_path: Path, resources_dir: Path) -> None:
     )
 
 
+def test_calculate_line_numbers():
+    line_numbers = calculate_line_numbers("a\n" * 9 + "b")
+
+    assert len(line_numbers) == 10
+    assert line_numbers[0] == "&nbsp;&nbsp;1.&nbsp;"
+    assert line_numbers[9] == "10.&nbsp;"
+
+
+def test_sort_problems(tmp_path):
+    file = tmp_path / "document.tex"
+    late = Problem((7, 1), "late", Aspell, file)
+    early = Problem((2, 1), "early", Aspell, file)
+    general = Problem(None, "general", Aspell, file)
+    yalafi = Problem((4, 1), "yalafi", YaLafi, file)
+
+    general_problems, problem_values = sort_problems(
+        {"0": late, "1": early, "2": general, "3": yalafi},
+    )
+
+    assert general_problems == [yalafi, general]
+    assert problem_values == [early, late]
+
+
+def test_highlight_escapes_html(tmp_path):
+    problem = Problem(
+        position=(1, 3),
+        text="b<c",
+        checker=Aspell,
+        file=tmp_path / "document.tex",
+        description="some error",
+    )
+    problem.uid = "uid"
+
+    highlighted = highlight("a<b<c>d\ne&f\n", [problem])
+
+    assert highlighted == (
+        "a&lt;"
+        '<span class="under is-warning" title="some error" '
+        "onclick=\"jumpTo('uidList')\">b&lt;c</span>"
+        "&gt;d\n"
+        "e&amp;f\n"
+    )
+
+
 def test_interval(tmp_path):
     problem = Problem(
         position=(0, 5),
@@ -81,7 +130,6 @@ def test_interval(tmp_path):
     assert interval.html_tag_title == "some error"
 
 
-@pytest.mark.xfail(reason="Interval doesn't work, see #128", strict=False)
 @pytest.mark.parametrize(
     ("input_tuples", "expected"),
     [
@@ -152,6 +200,31 @@ def test_interval_intersection(
     assert _interval_lists_equal(intersection, expected_intersecion)
 
 
+def test_resolve_interval_intersections():
+    intervals = _parse_interval_tuples(
+        [
+            ((5, 1), 10, "description_0"),
+            ((5, 3), 2, "description_1"),
+            ((5, 4), 2, "description_2"),
+            ((5, 20), 3, "description_3"),
+        ],
+    )
+
+    resolve_interval_intersections(intervals)
+
+    expected = _parse_interval_tuples(
+        [
+            ((5, 1), 2, "description_0"),
+            ((5, 3), 1, "description_0, description_1"),
+            ((5, 4), 1, "description_0, description_1, description_2"),
+            ((5, 5), 1, "description_0, description_2"),
+            ((5, 6), 5, "description_0"),
+            ((5, 20), 3, "description_3"),
+        ],
+    )
+    assert _interval_lists_equal(intervals, expected)
+
+
 def _interval_equals(first: Interval, second: Interval) -> bool:
     return (
         first.start == second.start
@@ -0,0 +1,267 @@
+# LaTeXBuddy tests
+# Copyright (C) 2021-2022  LaTeXBuddy
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from latexbuddy.modules.aspell import Aspell
+from latexbuddy.modules.chktex import Chktex
+from latexbuddy.preprocessor import LineProblemFilter
+from latexbuddy.preprocessor import ModuleProblemFilter
+from latexbuddy.preprocessor import Preprocessor
+from latexbuddy.preprocessor import ProblemFilter
+from latexbuddy.preprocessor import SeverityProblemFilter
+from latexbuddy.preprocessor import WhitelistKeyProblemFilter
+from latexbuddy.problem import Problem
+from latexbuddy.problem import ProblemSeverity
+from latexbuddy.texfile import TexFile
+
+_DOCUMENT_CONTENTS = R"""\documentclass{article}
+\begin{document}
+% buddy ignore-next line
+Ignored line.
+%buddy ignore-next 2 lines
+Ignored line.
+Ignored line.
+% buddy begin-ignore modules Aspell Chktex
+Ignored for Aspell and Chktex.
+% buddy end-ignore module Aspell
+Ignored for Chktex.
+% buddy end-ignore module Chktex
+% buddy begin-ignore severity error
+Ignored errors.
+% buddy end-ignore severities error
+% buddy begin-ignore whitelist-keys some_key
+Ignored key.
+% buddy end-ignore whitelist-key some_key
+% buddy begin-ignore
+Everything ignored from here on.
+% buddy end-ignore something invalid
+\end{document}
+"""
+
+
+@pytest.fixture
+def preprocessor(tmp_path: Path) -> Preprocessor:
+    document = tmp_path / "document.tex"
+    document.write_text(_DOCUMENT_CONTENTS)
+
+    preprocessor = Preprocessor()
+    preprocessor.regex_parse_preprocessor_comments(
+        TexFile(document, compile_tex=False),
+    )
+    return preprocessor
+
+
+def test_parse_filters(preprocessor: Preprocessor) -> None:
+    filters = [
+        (type(f), f.start_line, f.end_line) for f in preprocessor.filters
+    ]
+
+    assert filters == [
+        (LineProblemFilter, 4, 4),
+        (LineProblemFilter, 6, 7),
+        (ModuleProblemFilter, 9, 10),
+        (ModuleProblemFilter, 9, 12),
+        (SeverityProblemFilter, 14, 15),
+        (WhitelistKeyProblemFilter, 17, 18),
+        (LineProblemFilter, 20, None),
+    ]
+    assert [
+        f.module_name for f in preprocessor.filters
+        if isinstance(f, ModuleProblemFilter)
+    ] == ["Aspell", "Chktex"]
+
+
+def test_parse_invalid_command(
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+) -> None:
+    document = tmp_path / "invalid.tex"
+    document.write_text("% buddy end-ignore something invalid\n")
+
+    Preprocessor().regex_parse_preprocessor_comments(
+        TexFile(document, compile_tex=False),
+    )
+
+    assert "Could not parse preprocessing command in line 1" in caplog.text
+
+
+@pytest.mark.parametrize("newline", ["\r", "\r\n"])
+def test_parse_non_lf_line_endings(tmp_path: Path, newline: str) -> None:
+    document = tmp_path / "line_endings.tex"
+    document.write_bytes(
+        newline.join(
+            [
+                "a",
+                "% buddy ignore-next line",
+                "b",
+                "% buddy begin-ignore module Aspell",
+                "c",
+                "% buddy end-ignore module Aspell",
+                "",
+            ],
+        ).encode(),
+    )
+
+    preprocessor = Preprocessor()
+    preprocessor.regex_parse_preprocessor_comments(
+        TexFile(document, compile_tex=False),
+    )
+
+    filters = [
+        (type(f), f.start_line, f.end_line) for f in preprocessor.filters
+    ]
+    assert filters == [
+        (LineProblemFilter, 3, 3),
+        (ModuleProblemFilter, 5, 6),
+    ]
+
+
+@pytest.mark.parametrize(
+    "position, checker, severity, key, expected",
+    [
+        ((3, 1), Aspell, ProblemSeverity.WARNING, None, True),
+        ((4, 1), Aspell, ProblemSeverity.WARNING, None, False),
+        ((7, 1), Aspell, ProblemSeverity.WARNING, None, False),
+        ((8, 1), Aspell, ProblemSeverity.WARNING, None, True),
+        ((9, 1), Aspell, ProblemSeverity.WARNING, None, False),
+        ((11, 1), Aspell, ProblemSeverity.WARNING, None, True),
+        ((11, 1), Chktex, ProblemSeverity.WARNING, None, False),
+        ((14, 1), Aspell, ProblemSeverity.WARNING, None, True),
+        ((14, 1), Aspell, ProblemSeverity.ERROR, None, False),
+        ((17, 1), Aspell, ProblemSeverity.WARNING, "other_key", True),
+        ((17, 1), Aspell, ProblemSeverity.WARNING, "some_key", False),
+        ((22, 1), Aspell, ProblemSeverity.WARNING, None, False),
+    ],
+)
+def test_matches_preprocessor_filter(
+    preprocessor: Preprocessor,
+    position: tuple[int, int],
+    checker: type,
+    severity: ProblemSeverity,
+    key: str | None,
+    expected: bool,
+) -> None:
+    problem = Problem(
+        position,
+        "text",
+        checker,
+        Path("document.tex"),
+        severity=severity,
+        key=key,
+    )
+
+    assert preprocessor.matches_preprocessor_filter(problem) is expected
+
+
+def test_parse_duplicate_begin_ignore(tmp_path: Path) -> None:
+    document = tmp_path / "duplicate.tex"
+    document.write_text(
+        "% buddy begin-ignore modules Aspell Aspell\n"
+        "% buddy begin-ignore module Aspell\n"
+        "% buddy end-ignore module Aspell\n",
+    )
+
+    preprocessor = Preprocessor()
+    preprocessor.regex_parse_preprocessor_comments(
+        TexFile(document, compile_tex=False),
+    )
+
+    assert [(f.start_line, f.end_line) for f in preprocessor.filters] == [
+        (2, 3),
+    ]
+
+
+def test_filters_added_after_parsing(preprocessor: Preprocessor) -> None:
+    problem = Problem((11, 1), "text", Aspell, Path("document.tex"))
+    assert preprocessor.matches_preprocessor_filter(problem)
+
+    preprocessor.filters.append(ModuleProblemFilter("Aspell", 11, 11))
+
+    assert not preprocessor.matches_preprocessor_filter(problem)
+    assert preprocessor.apply_preprocessor_filter([problem]) == []
+
+
+def test_filters_ended_after_parsing(preprocessor: Preprocessor) -> None:
+    problem = Problem((22, 1), "text", Aspell, Path("document.tex"))
+    assert not preprocessor.matches_preprocessor_filter(problem)
+
+    preprocessor.filters[-1].end(21)
+
+    assert preprocessor.matches_preprocessor_filter(problem)
+
+
+@pytest.mark.parametrize(
+    "problem_filter",
+    [
+        LineProblemFilter(2, 3),
+        ModuleProblemFilter("Aspell", 2, 3),
+        SeverityProblemFilter(ProblemSeverity.ERROR, 2, 3),
+        WhitelistKeyProblemFilter("some_key", 2, 3),
+        LineProblemFilter(2),
+    ],
+)
+def test_match_agrees_with_preprocessor(
+    problem_filter: ProblemFilter,
+) -> None:
+    preprocessor = Preprocessor()
+    preprocessor.filters.append(problem_filter)
+
+    for position in [None, (1, 1), (2, 1), (3, 1), (4, 1)]:
+        for checker in [Aspell, Chktex]:
+            for severity in [ProblemSeverity.WARNING, ProblemSeverity.ERROR]:
+                for key in [None, "some_key", "other_key"]:
+                    problem = Problem(
+                        position,
+                        "text",
+                        checker,
+                        Path("document.tex"),
+                        severity=severity,
+                        key=key,
+                    )
+
+                    assert problem_filter.match(problem) is not \
+                        preprocessor.matches_preprocessor_filter(problem)
+
+
+class _TextProblemFilter(ProblemFilter):
+    """Filter implementing only the abstract methods of ProblemFilter."""
+
+    def __init__(self, text: str, start_line: int, end_line: int):
+        super().__init__(start_line, end_line)
+        self.text = text
+
+    def custom_match(self, problem: Problem) -> bool:
+        return problem.text == self.text
+
+    def custom_parameters_equal(self, other: ProblemFilter) -> bool:
+        return isinstance(other, _TextProblemFilter) \
+            and other.text == self.text
+
+
+def test_custom_filter(preprocessor: Preprocessor) -> None:
+    preprocessor.filters.append(_TextProblemFilter("text", 3, 3))
+
+    problems = [
+        Problem((3, 1), "text", Aspell, Path("document.tex")),
+        Problem((3, 1), "other", Aspell, Path("document.tex")),
+        Problem((11, 1), "text", Aspell, Path("document.tex")),
+    ]
+
+    assert preprocessor.apply_preprocessor_filter(problems) == problems[1:]
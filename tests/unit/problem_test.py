@@ -0,0 +1,36 @@
+# LaTeXBuddy tests
+# Copyright (C) 2021-2022  LaTeXBuddy
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from latexbuddy.modules.aspell import Aspell
+from latexbuddy.problem import Problem
+
+
+def test_uids_of_identical_problems_differ(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # problems created within the same clock tick
+    monkeypatch.setattr(time, "time", lambda: 0.0)
+
+    first = Problem((1, 1), "text", Aspell, Path("document.tex"))
+    second = Problem((1, 1), "text", Aspell, Path("document.tex"))
+
+    assert first.uid != second.uid